@@ -0,0 +1,16 @@
+"""
+Optional Numba support for the numeric kernels
+Falls back to a no-op decorator when numba is not installed
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        def decorate(func):
+            return func
+
+        if args and callable(args[0]):
+            return args[0]
+        return decorate
@@ -4,10 +4,176 @@ Provides deterministic calculations to complement LLM agents
 """
 
 from typing import List, Dict, Any, Tuple
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 from datetime import datetime, timedelta
 from dataclasses import dataclass
-import statistics
-import math
+from functools import lru_cache
+import hashlib
+import heapq
+import os
+import pickle
+import re
+
+import numpy as np
+import pandas as pd
+
+from ._njit import njit
+
+try:
+    # Optional fast path: C-level multi-keyword scan for categorization
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+@njit(cache=True, fastmath=True)
+def _linreg_kernel(y):
+    """Least-squares fit of y against x = 0..n-1: (slope, intercept, denominator)"""
+    n = y.size
+    x_mean = (n - 1) / 2.0
+    y_mean = y.mean()
+
+    # x is fixed at 0..n-1, so the centered sums have closed forms:
+    # sum((x-xm)^2) = n*(n^2-1)/12 and sum((x-xm)*(y-ym)) = sum(x*y) - n*xm*ym
+    denominator = n * (n * n - 1) / 12.0
+    numerator = np.dot(np.arange(n).astype(np.float64), y) - n * x_mean * y_mean
+
+    slope = numerator / denominator if denominator != 0 else 0.0
+    return slope, y_mean - slope * x_mean, denominator
+
+
+@njit(cache=True, fastmath=True)
+def _forecast_kernel(y, periods_ahead):
+    """Linear forecast periods_ahead out in one fused pass: (forecast, slope, se_pred)"""
+    n = y.size
+
+    # Accumulate sum(y), sum(x*y), and sum(y^2) in a single sweep;
+    # sum(x) and sum(x^2) have closed forms since x is 0..n-1
+    s_y = 0.0
+    s_xy = 0.0
+    s_y2 = 0.0
+    for i in range(n):
+        v = y[i]
+        s_y += v
+        s_xy += i * v
+        s_y2 += v * v
+
+    x_mean = (n - 1) / 2.0
+    y_mean = s_y / n
+    denominator = n * (n * n - 1) / 12.0
+    slope = (s_xy - n * x_mean * y_mean) / denominator if denominator != 0 else 0.0
+    intercept = y_mean - slope * x_mean
+
+    x_pred = n + periods_ahead - 1
+    forecast = slope * x_pred + intercept
+
+    # Residual sum of squares via the identity SSres = sum(y^2) - a*sum(y) - b*sum(x*y)
+    ss_res = s_y2 - intercept * s_y - slope * s_xy
+    if ss_res < 0.0:  # Guard against fp cancellation on near-perfect fits
+        ss_res = 0.0
+    mse = ss_res / (n - 2) if n > 2 else 0.0
+
+    # Closed-form standard error of prediction at x_pred: grows with the
+    # forecast horizon instead of the flat residual-only estimate
+    if denominator != 0:
+        se_pred = np.sqrt(mse * (1.0 + 1.0 / n + (x_pred - x_mean) ** 2 / denominator))
+    else:
+        se_pred = np.sqrt(mse)
+    return forecast, slope, se_pred
+
+
+# Small-int codes produced by _analyze_series_kernel
+_STATUS_ON_TRACK, _STATUS_OVER, _STATUS_UNDER, _STATUS_NO_BUDGET = 0, 1, 2, 3
+_TREND_STABLE, _TREND_INCREASING, _TREND_DECREASING, _TREND_INSUFFICIENT = 0, 1, 2, 3
+
+_STATUS_LABELS = ('on_track', 'over_budget', 'under_budget', 'no_budget_set')
+_TREND_LABELS = ('stable', 'increasing', 'decreasing', 'insufficient_data')
+
+# Public aliases so callers can branch on the small-int status codes and
+# keep the string labels for display only
+STATUS_ON_TRACK = _STATUS_ON_TRACK
+STATUS_OVER_BUDGET = _STATUS_OVER
+STATUS_UNDER_BUDGET = _STATUS_UNDER
+STATUS_NO_BUDGET = _STATUS_NO_BUDGET
+STATUS_LABELS = _STATUS_LABELS
+
+_SIGNIFICANCE_LABELS = ('minor', 'significant')
+
+
+@njit(cache=True, fastmath=True)
+def _analyze_series_kernel(y, actual, budget, periods_ahead):
+    """Fused budget variance + trend + forecast over one series in one call"""
+    if budget == 0.0:
+        variance_pct = 0.0
+        status = _STATUS_NO_BUDGET
+    else:
+        variance_pct = (actual - budget) / budget * 100.0
+        if variance_pct > 10.0:
+            status = _STATUS_OVER
+        elif variance_pct < -10.0:
+            status = _STATUS_UNDER
+        else:
+            status = _STATUS_ON_TRACK
+
+    forecast, slope, se_pred = _forecast_kernel(y, periods_ahead)
+
+    if y.size < 2:
+        trend = _TREND_INSUFFICIENT
+    elif slope > 0.05:
+        trend = _TREND_INCREASING
+    elif slope < -0.05:
+        trend = _TREND_DECREASING
+    else:
+        trend = _TREND_STABLE
+
+    return variance_pct, status, forecast, slope, se_pred, trend
+
+
+@njit(cache=True, fastmath=True)
+def _moving_average_kernel(values, window):
+    """Moving average over a float64 array (values.size >= window)"""
+    out = np.empty(values.size - window + 1, dtype=np.float64)
+
+    # Single-pass running sum: O(n) instead of re-summing each window
+    running = 0.0
+    for i in range(window):
+        running += values[i]
+    out[0] = running / window
+
+    for i in range(window, values.size):
+        running += values[i] - values[i - window]
+        out[i - window + 1] = running / window
+
+    return out
+
+
+@lru_cache(maxsize=512)
+def _moving_average_cached(values: Tuple[float, ...], window: int) -> Tuple[float, ...]:
+    """Tuple-keyed cache over the moving-average kernel for repeated series"""
+    return tuple(_moving_average_kernel(np.asarray(values, dtype=np.float64), window).tolist())
+
+
+@lru_cache(maxsize=512)
+def _forecast_cached(values: Tuple[float, ...], periods_ahead: int) -> Dict[str, Any]:
+    """Tuple-keyed cache over the forecast kernel (values has >= 3 points)"""
+    forecast, slope, se_pred = _forecast_kernel(np.asarray(values, dtype=np.float64), periods_ahead)
+    forecast = float(forecast)
+
+    # 95% confidence interval (approximate)
+    margin_of_error = 1.96 * float(se_pred)
+    confidence_interval = (
+        max(0, forecast - margin_of_error),
+        forecast + margin_of_error
+    )
+
+    return {
+        'forecast': round(max(0, forecast), 2),
+        'confidence_interval': (round(confidence_interval[0], 2), round(confidence_interval[1], 2)),
+        'trend': SpendingAnalyzer.detect_trend_direction(list(values)),
+        'slope': round(float(slope), 4)
+    }
 
 
 @dataclass
@@ -20,6 +186,15 @@ class Transaction:
     description: str
 
 
+@dataclass
+class TransactionTable:
+    """Columnar (structure-of-arrays) transaction store for vectorized analysis"""
+    date: np.ndarray      # datetime64[D]
+    amount: np.ndarray    # float64
+    merchant: np.ndarray  # object (original merchant strings)
+    category: np.ndarray  # int8 codes into CATEGORY_NAMES
+
+
 @dataclass
 class SpendingMetrics:
     """Structured spending analysis results"""
@@ -44,35 +219,40 @@ class SpendingAnalyzer:
         'healthcare': ['doctor', 'pharmacy', 'hospital', 'medical', 'dental'],
         'other': []  # Default category
     }
-    
+
     @staticmethod
-    def categorize_transactions(transactions: List[Dict]) -> List[Transaction]:
+    def categorize_transactions(transactions: List[Dict], workers: int = 1) -> List[Transaction]:
         """
         Rule-based transaction categorization
         Returns structured Transaction objects with categories
+        Categorization is embarrassingly parallel over rows, so large
+        batches can be split across processes via workers > 1
         """
+        if workers > 1 and len(transactions) > _PARALLEL_MIN_ROWS:
+            chunk_size = -(-len(transactions) // workers)
+            chunks = [
+                transactions[i:i + chunk_size]
+                for i in range(0, len(transactions), chunk_size)
+            ]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(chain.from_iterable(
+                    executor.map(_categorize_chunk, chunks)
+                ))
+
         categorized = []
-        
-        for txn in transactions:
+
+        # Batch-parse all dates in one pass
+        dates = _parse_dates([txn.get('date', '') for txn in transactions])
+
+        for txn, date in zip(transactions, dates):
             # Extract transaction details
             merchant = txn.get('merchant', '').lower()
             description = txn.get('description', '').lower()
             amount = abs(float(txn.get('amount', 0)))
-            
+
             # Determine category using rule-based matching
-            category = 'other'
-            for cat, keywords in SpendingAnalyzer.CATEGORY_RULES.items():
-                if any(keyword in merchant or keyword in description for keyword in keywords):
-                    category = cat
-                    break
-            
-            # Parse date
-            date_str = txn.get('date', '')
-            try:
-                date = datetime.strptime(date_str, '%Y-%m-%d')
-            except:
-                date = datetime.now()
-            
+            category = _match_category(merchant + ' ' + description)
+
             categorized.append(Transaction(
                 date=date,
                 amount=amount,
@@ -80,8 +260,86 @@ class SpendingAnalyzer:
                 category=category,
                 description=txn.get('description', '')
             ))
-        
+
         return categorized
+
+    @staticmethod
+    def categorize_transactions_soa(transactions: List[Dict]) -> TransactionTable:
+        """
+        Columnar counterpart of categorize_transactions
+        Returns a TransactionTable of parallel arrays instead of per-row objects
+        """
+        n = len(transactions)
+        amounts = np.empty(n, dtype=np.float64)
+        merchants = np.empty(n, dtype=object)
+        texts = np.empty(n, dtype=object)
+
+        # Parse each date string exactly once into int-backed datetime64[D]
+        # ordinals; NumPy's C parser handles the clean all-ISO case without
+        # ever materializing Python datetime objects
+        raw_dates = [txn.get('date', '') for txn in transactions]
+        # Strict pre-screen so both ingest paths agree on validity: the
+        # NumPy parser would silently turn empty strings into NaT (which
+        # later overflows the bincount month arithmetic) and accepts
+        # looser ISO forms ('2024', '2024-01') that the coercing parser
+        # replaces with the current time
+        if all(_DATE_RE.match(s) for s in raw_dates):
+            try:
+                dates = np.array(raw_dates, dtype='datetime64[D]')
+            except ValueError:
+                # Right shape but impossible dates, e.g. month 13
+                dates = np.array(_parse_dates(raw_dates), dtype='datetime64[D]')
+        else:
+            # Malformed entries present - go through the coercing parser
+            dates = np.array(_parse_dates(raw_dates), dtype='datetime64[D]')
+
+        for i, txn in enumerate(transactions):
+            merchant = txn.get('merchant', '')
+            amounts[i] = abs(float(txn.get('amount', 0)))
+            merchants[i] = merchant
+            texts[i] = (merchant + ' ' + txn.get('description', '')).lower()
+
+        # Classify each distinct text at most once, then scatter the codes
+        # back over the duplicates (merchants repeat heavily)
+        unique_texts, inverse = np.unique(texts, return_inverse=True)
+        unique_codes = np.fromiter(
+            (_classify_code(text) for text in unique_texts),
+            dtype=np.int8,
+            count=unique_texts.size,
+        )
+        categories = unique_codes[inverse]
+
+        return TransactionTable(date=dates, amount=amounts, merchant=merchants, category=categories)
+
+    @staticmethod
+    def calculate_monthly_spending_soa(table: TransactionTable) -> Dict[str, Dict[str, float]]:
+        """
+        Monthly spending by category from a TransactionTable
+        One vectorized bincount pass instead of per-row dict updates
+        """
+        if table.amount.size == 0:
+            return {}
+
+        months = table.date.astype('datetime64[M]')
+        first_month = months.min()
+        month_index = (months - first_month).astype(np.int64)
+
+        n_months = int(month_index.max()) + 1
+        n_categories = len(CATEGORY_NAMES)
+        totals = np.bincount(
+            month_index * n_categories + table.category,
+            weights=table.amount,
+            minlength=n_months * n_categories,
+        ).reshape(n_months, n_categories)
+
+        monthly_data = {}
+        for m in range(n_months):
+            nonzero = np.nonzero(totals[m])[0]
+            if nonzero.size:
+                monthly_data[str(first_month + m)] = {
+                    CATEGORY_NAMES[c]: float(totals[m, c]) for c in nonzero
+                }
+        return monthly_data
     
     @staticmethod
     def calculate_monthly_spending(transactions: List[Transaction]) -> Dict[str, Dict[str, float]]:
@@ -89,21 +347,102 @@ class SpendingAnalyzer:
         Calculate monthly spending by category
         Returns: {month: {category: amount}}
         """
-        monthly_data = {}
-        
+        monthly_data = defaultdict(lambda: defaultdict(float))
+
         for txn in transactions:
-            month_key = txn.date.strftime('%Y-%m')
-            
-            if month_key not in monthly_data:
-                monthly_data[month_key] = {}
-            
-            if txn.category not in monthly_data[month_key]:
-                monthly_data[month_key][txn.category] = 0
-            
+            # Small-int month key: one hash op, no per-row string formatting
+            month_key = txn.date.year * 12 + (txn.date.month - 1)
             monthly_data[month_key][txn.category] += txn.amount
-        
-        return monthly_data
+
+        # Render 'YYYY-MM' keys only at the output boundary
+        return {
+            '{:04d}-{:02d}'.format(key // 12, key % 12 + 1): dict(categories)
+            for key, categories in monthly_data.items()
+        }
     
+    @staticmethod
+    def totals_and_variance(transactions: List[Dict],
+                            budget_by_category: Dict[str, float]) -> Dict[str, Any]:
+        """
+        Categorize raw transactions, total every category, and compute
+        budget variance for the budgeted ones - one fused sweep instead
+        of separate categorize / filter / sum / variance passes.
+        Returns {'totals': {category: amount}, 'variance': {category: ...}}
+        """
+        table = SpendingAnalyzer.categorize_transactions_soa(transactions)
+        totals_vec = np.bincount(
+            table.category, weights=table.amount, minlength=len(CATEGORY_NAMES)
+        )
+
+        totals = {
+            name: float(totals_vec[code])
+            for name, code in CAT_TO_ID.items()
+            if totals_vec[code] > 0
+        }
+        variance = {
+            category: BudgetCalculator.calculate_variance(
+                totals.get(category, 0.0), budgeted
+            )
+            for category, budgeted in budget_by_category.items()
+        }
+        return {'totals': totals, 'variance': variance}
+
+    @staticmethod
+    def analyze_batch(tx_df: pd.DataFrame, budgets_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Vectorized spending analysis for N users in one pass.
+
+        tx_df has columns user_id, date, merchant, amount, category_code
+        (small-int codes from CAT_TO_ID - plain ints group far faster
+        than Categorical keys). budgets_df is indexed by user_id with one
+        column per budgeted category. Returns one row per user holding
+        per-category totals plus <category>_variance_pct and
+        <category>_status_code columns.
+        """
+        totals = (
+            tx_df.groupby(['user_id', 'category_code'])['amount']
+            .sum()
+            .unstack(fill_value=0.0)
+        )
+        totals.columns = [CATEGORY_NAMES[code] for code in totals.columns]
+        result = totals.reindex(budgets_df.index, fill_value=0.0)
+
+        for category in budgets_df.columns:
+            if category not in result.columns:
+                result[category] = 0.0
+            budget = budgets_df[category].to_numpy(dtype=np.float64)
+            actual = result[category].to_numpy(dtype=np.float64)
+            no_budget = budget == 0
+            safe_budget = np.where(no_budget, 1.0, budget)
+            pct = np.where(no_budget, 0.0, (actual - budget) / safe_budget * 100.0)
+            status = (pct > 10).astype(np.int8) + 2 * (pct < -10).astype(np.int8)
+            result[category + '_variance_pct'] = pct
+            result[category + '_status_code'] = np.where(
+                no_budget, _STATUS_NO_BUDGET, status
+            ).astype(np.int8)
+        return result
+
+    @staticmethod
+    def recent_transactions(transactions: List[Transaction], k: int = 5) -> List[Transaction]:
+        """
+        The k most recent transactions, newest first
+        Heap selection in O(n log k) instead of a full O(n log n) sort
+        """
+        return heapq.nlargest(k, transactions, key=lambda t: t.date)
+
+    @staticmethod
+    def recent_transactions_soa(table: TransactionTable, k: int = 5) -> np.ndarray:
+        """
+        Row indices of the k most recent table entries, newest first
+        O(n) argpartition selection on the date column
+        """
+        n = table.date.size
+        if n <= k:
+            return np.argsort(table.date)[::-1]
+
+        candidates = np.argpartition(table.date, n - k)[n - k:]
+        return candidates[np.argsort(table.date[candidates])[::-1]]
+
     @staticmethod
     def calculate_moving_average(values: List[float], window: int = 3) -> List[float]:
         """
@@ -111,13 +450,8 @@ class SpendingAnalyzer:
         """
         if len(values) < window:
             return values
-        
-        moving_averages = []
-        for i in range(len(values) - window + 1):
-            avg = sum(values[i:i + window]) / window
-            moving_averages.append(avg)
-        
-        return moving_averages
+
+        return list(_moving_average_cached(tuple(values), window))
     
     @staticmethod
     def detect_trend_direction(values: List[float]) -> str:
@@ -126,22 +460,12 @@ class SpendingAnalyzer:
         """
         if len(values) < 2:
             return "insufficient_data"
-        
-        n = len(values)
-        x_values = list(range(n))
-        
-        # Calculate linear regression slope
-        x_mean = sum(x_values) / n
-        y_mean = sum(values) / n
-        
-        numerator = sum((x_values[i] - x_mean) * (values[i] - y_mean) for i in range(n))
-        denominator = sum((x_values[i] - x_mean) ** 2 for i in range(n))
-        
+
+        slope, _, denominator = _linreg_kernel(np.asarray(values, dtype=np.float64))
+
         if denominator == 0:
             return "stable"
         
-        slope = numerator / denominator
-        
         if slope > 0.05:  # 5% threshold
             return "increasing"
         elif slope < -0.05:
@@ -150,6 +474,176 @@ class SpendingAnalyzer:
             return "stable"
 
 
+# Below this row count process pool overhead outweighs the parallel win
+_PARALLEL_MIN_ROWS = 10000
+
+
+def _categorize_chunk(transactions: List[Dict]) -> List[Transaction]:
+    """Worker entry point: sequential categorization of one chunk"""
+    return SpendingAnalyzer.categorize_transactions(transactions)
+
+
+# Category names and small-int codes for the columnar (SoA) representation
+CATEGORY_NAMES: Tuple[str, ...] = tuple(SpendingAnalyzer.CATEGORY_RULES)
+CAT_TO_ID: Dict[str, int] = {name: i for i, name in enumerate(CATEGORY_NAMES)}
+
+
+def _build_keyword_automaton():
+    """
+    Compile CATEGORY_RULES into an Aho-Corasick automaton so every
+    merchant+description string is scanned once at C level instead of
+    once per keyword. Returns None when pyahocorasick is not installed.
+    """
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for priority, (category, keywords) in enumerate(SpendingAnalyzer.CATEGORY_RULES.items()):
+        for keyword in keywords:
+            automaton.add_word(keyword, (priority, category))
+    automaton.make_automaton()
+    return automaton
+
+
+# Agent processes are spawned repeatedly in workflows, so the compiled
+# matcher is pickled to disk and reloaded instead of rebuilt each start
+_MATCHER_CACHE_PATH = os.path.join(
+    os.path.expanduser('~'), '.cache', 'astrafin', 'category_matcher.pkl'
+)
+
+
+def _load_or_build_matcher():
+    """
+    Return the keyword automaton, reusing the on-disk pickle when its
+    fingerprint still matches CATEGORY_RULES. Cache failures of any kind
+    fall back to an in-process build; the cache must never break import.
+    """
+    if ahocorasick is None:
+        return None
+
+    fingerprint = hashlib.sha256(
+        repr(SpendingAnalyzer.CATEGORY_RULES).encode()
+    ).hexdigest()
+
+    try:
+        with open(_MATCHER_CACHE_PATH, 'rb') as f:
+            cached_fingerprint, automaton = pickle.load(f)
+        if cached_fingerprint == fingerprint:
+            return automaton
+    except Exception:
+        pass
+
+    automaton = _build_keyword_automaton()
+    try:
+        os.makedirs(os.path.dirname(_MATCHER_CACHE_PATH), exist_ok=True)
+        with open(_MATCHER_CACHE_PATH, 'wb') as f:
+            pickle.dump((fingerprint, automaton), f)
+    except OSError:
+        pass
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _load_or_build_matcher()
+
+# Inverted word -> (priority, category) index over the single-word
+# keywords: one dict probe per token instead of a full text scan
+_KW_INDEX: Dict[str, Tuple[int, str]] = {
+    keyword: (priority, category)
+    for priority, (category, keywords) in enumerate(SpendingAnalyzer.CATEGORY_RULES.items())
+    for keyword in keywords
+    if ' ' not in keyword
+}
+
+# Zero-dependency fallback: one compiled regex with a named group per
+# category, so each text still gets a single C-level scan. The lookahead
+# keeps matches zero-width so overlapping keywords are all reported.
+_CATEGORY_RE = re.compile('(?={})'.format('|'.join(
+    '(?P<{}>{})'.format(category, '|'.join(map(re.escape, keywords)))
+    for category, keywords in SpendingAnalyzer.CATEGORY_RULES.items()
+    if keywords
+)))
+
+
+@lru_cache(maxsize=8192)
+def _match_category(text: str) -> str:
+    """
+    Match an already-lowercased transaction text against CATEGORY_RULES,
+    honoring category declaration order as priority.
+    Cached: merchants repeat heavily, so most calls are O(1) hits.
+    """
+    # First chance: whole-word hits on the top-priority category can
+    # short-circuit, since no substring match could rank higher. Lower-
+    # priority word hits still need the scan (a substring hit may win).
+    for word in text.split():
+        hit = _KW_INDEX.get(word)
+        if hit is not None and hit[0] == 0:
+            return hit[1]
+
+    if _KEYWORD_AUTOMATON is not None:
+        best = None
+        for _, hit in _KEYWORD_AUTOMATON.iter(text):
+            if best is None or hit < best:
+                best = hit
+                if best[0] == 0:  # Highest-priority category, stop early
+                    break
+        return best[1] if best else 'other'
+
+    best_priority = None
+    for match in _CATEGORY_RE.finditer(text):
+        priority = CAT_TO_ID[match.lastgroup]
+        if best_priority is None or priority < best_priority:
+            best_priority = priority
+            if priority == 0:  # Highest-priority category, stop early
+                break
+    return CATEGORY_NAMES[best_priority] if best_priority is not None else 'other'
+
+
+@lru_cache(maxsize=4096)
+def _classify_code(text: str) -> int:
+    """Category code for an already-lowercased text, cached per string"""
+    return CAT_TO_ID[_match_category(text)]
+
+
+# Cheap shape check so malformed dates skip strptime and its exception
+# machinery entirely. Lenient on zero-padding ('2024-1-1'), matching what
+# strptime and the pandas batch parser both accept - strptime remains the
+# real validator
+_DATE_RE = re.compile(r'^\d{4}-\d{1,2}-\d{1,2}$')
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str):
+    """
+    Parse a YYYY-MM-DD date string, returning None when malformed.
+    Cached because real transaction streams repeat dates heavily.
+    """
+    if not _DATE_RE.match(date_str):
+        return None
+    try:
+        return datetime.strptime(date_str, '%Y-%m-%d')
+    except ValueError:  # Right shape but impossible date, e.g. month 13
+        return None
+
+
+# Below this size the pandas batch-parse dispatch overhead outweighs
+# the per-row strptime cost
+_BATCH_PARSE_MIN = 32
+
+
+def _parse_dates(date_strs: List[str]) -> List[datetime]:
+    """
+    Parse many YYYY-MM-DD strings, substituting the current time for
+    malformed entries. Large batches go through the pandas C parser in
+    one vectorized call instead of per-row strptime + exception handling.
+    """
+    if len(date_strs) >= _BATCH_PARSE_MIN:
+        parsed = pd.to_datetime(date_strs, format='%Y-%m-%d', errors='coerce')
+        now = datetime.now()
+        return [ts.to_pydatetime() if ts is not pd.NaT else now for ts in parsed]
+
+    return [_parse_date(s) or datetime.now() for s in date_strs]
+
+
 class BudgetCalculator:
     """Budget variance analysis with statistical methods"""
     
@@ -163,27 +657,25 @@ class BudgetCalculator:
                 'variance_percentage': 0,
                 'variance_amount': actual_spending,
                 'status': 'no_budget_set',
+                'status_code': _STATUS_NO_BUDGET,
                 'significance': 'unknown'
             }
-        
+
         variance_amount = actual_spending - budgeted_amount
         variance_percentage = (variance_amount / budgeted_amount) * 100
-        
-        # Determine status
-        if variance_percentage > 10:
-            status = 'over_budget'
-        elif variance_percentage < -10:
-            status = 'under_budget'
-        else:
-            status = 'on_track'
-        
+
+        # Branchless status classification: the two threshold comparisons
+        # map straight onto the _STATUS_* codes (over=1, under=2, else 0)
+        status_code = int(variance_percentage > 10) + 2 * int(variance_percentage < -10)
+
         # Statistical significance (simplified)
-        significance = 'significant' if abs(variance_percentage) > 15 else 'minor'
-        
+        significance = _SIGNIFICANCE_LABELS[int(abs(variance_percentage) > 15)]
+
         return {
             'variance_percentage': round(variance_percentage, 2),
             'variance_amount': round(variance_amount, 2),
-            'status': status,
+            'status': _STATUS_LABELS[status_code],
+            'status_code': status_code,
             'significance': significance
         }
     
@@ -193,26 +685,47 @@ class BudgetCalculator:
         """
         Analyze variance for each spending category
         """
+        if not monthly_data:
+            return {}
+
+        # Average spending per category, skipping months where a category
+        # is absent (same semantics as the old per-month list building)
+        df = pd.DataFrame(monthly_data)  # index=categories, columns=months
+        means = df.mean(axis=1)
+
+        budget = pd.Series(budget_by_category).reindex(means.index).fillna(0)
+
+        means_arr = means.to_numpy()
+        budget_arr = budget.to_numpy(dtype=np.float64)
+        no_budget = budget_arr == 0
+
+        # Broadcast variance math across all categories at once
+        safe_budget = np.where(no_budget, 1.0, budget_arr)
+        pct = np.where(no_budget, 0.0, (means_arr - budget_arr) / safe_budget * 100)
+        amount = means_arr - budget_arr
+
+        status_code = np.select(
+            [no_budget, pct > 10, pct < -10],
+            [_STATUS_NO_BUDGET, _STATUS_OVER, _STATUS_UNDER],
+            default=_STATUS_ON_TRACK,
+        ).astype(np.int8)
+        significance = np.select(
+            [no_budget, np.abs(pct) > 15],
+            ['unknown', 'significant'],
+            default='minor',
+        )
+
         category_analysis = {}
-        
-        # Calculate average spending per category
-        category_totals = {}
-        for month_data in monthly_data.values():
-            for category, amount in month_data.items():
-                if category not in category_totals:
-                    category_totals[category] = []
-                category_totals[category].append(amount)
-        
-        # Calculate variance for each category
-        for category, amounts in category_totals.items():
-            avg_spending = sum(amounts) / len(amounts)
-            budgeted = budget_by_category.get(category, 0)
-            
-            category_analysis[category] = BudgetCalculator.calculate_variance(
-                avg_spending, budgeted
-            )
-            category_analysis[category]['average_spending'] = round(avg_spending, 2)
-        
+        for i, category in enumerate(means.index):
+            avg_spending = float(means_arr[i])
+            category_analysis[category] = {
+                'variance_percentage': 0 if no_budget[i] else round(float(pct[i]), 2),
+                'variance_amount': avg_spending if no_budget[i] else round(float(amount[i]), 2),
+                'status': _STATUS_LABELS[status_code[i]],
+                'status_code': int(status_code[i]),
+                'significance': str(significance[i]),
+                'average_spending': round(avg_spending, 2),
+            }
         return category_analysis
 
 
@@ -230,46 +743,10 @@ class TrendPredictor:
                 'confidence_interval': (0, 0),
                 'trend': 'insufficient_data'
             }
-        
-        n = len(historical_data)
-        x_values = list(range(n))
-        
-        # Linear regression calculation
-        x_mean = sum(x_values) / n
-        y_mean = sum(historical_data) / n
-        
-        numerator = sum((x_values[i] - x_mean) * (historical_data[i] - y_mean) for i in range(n))
-        denominator = sum((x_values[i] - x_mean) ** 2 for i in range(n))
-        
-        if denominator == 0:
-            slope = 0
-        else:
-            slope = numerator / denominator
-        
-        intercept = y_mean - slope * x_mean
-        
-        # Forecast next period
-        forecast_x = n + periods_ahead - 1
-        forecast = slope * forecast_x + intercept
-        
-        # Calculate standard error for confidence interval
-        residuals = [historical_data[i] - (slope * x_values[i] + intercept) for i in range(n)]
-        mse = sum(r ** 2 for r in residuals) / (n - 2) if n > 2 else 0
-        std_error = math.sqrt(mse)
-        
-        # 95% confidence interval (approximate)
-        margin_of_error = 1.96 * std_error
-        confidence_interval = (
-            max(0, forecast - margin_of_error),
-            forecast + margin_of_error
-        )
-        
-        return {
-            'forecast': round(max(0, forecast), 2),
-            'confidence_interval': (round(confidence_interval[0], 2), round(confidence_interval[1], 2)),
-            'trend': SpendingAnalyzer.detect_trend_direction(historical_data),
-            'slope': round(slope, 4)
-        }
+
+        # Memoized on the series itself: agent pipelines re-run the same
+        # forecast across sub-agents, so repeats are O(1) cache hits
+        return dict(_forecast_cached(tuple(historical_data), periods_ahead))
     
     @staticmethod
     def seasonal_adjustment(monthly_data: Dict[str, float]) -> Dict[str, float]:
@@ -290,56 +767,153 @@ class TrendPredictor:
         return seasonal_factors
 
 
+def analyze_series(monthly_values: List[float], actual_spending: float,
+                   budgeted_amount: float, periods_ahead: int = 1) -> Tuple[Dict[str, Any], str, Dict[str, Any]]:
+    """
+    Budget variance, trend direction, and forecast for one spending series
+    in a single fused kernel call.
+    Returns (variance_analysis, trend_direction, forecast_result) with the
+    same shapes as calculate_variance / detect_trend_direction /
+    forecast_spending, so callers can switch without other changes.
+    """
+    y = np.asarray(monthly_values, dtype=np.float64)
+    if y.size < 3:
+        # Short series fall back to the guarded individual paths
+        return (
+            BudgetCalculator.calculate_variance(actual_spending, budgeted_amount),
+            SpendingAnalyzer.detect_trend_direction(list(monthly_values)),
+            TrendPredictor.forecast_spending(list(monthly_values), periods_ahead),
+        )
+
+    variance_pct, status, forecast, slope, se_pred, trend = _analyze_series_kernel(
+        y, float(actual_spending), float(budgeted_amount), periods_ahead
+    )
+
+    if status == _STATUS_NO_BUDGET:
+        variance_analysis = {
+            'variance_percentage': 0,
+            'variance_amount': actual_spending,
+            'status': 'no_budget_set',
+            'status_code': _STATUS_NO_BUDGET,
+            'significance': 'unknown'
+        }
+    else:
+        variance_analysis = {
+            'variance_percentage': round(float(variance_pct), 2),
+            'variance_amount': round(actual_spending - budgeted_amount, 2),
+            'status': _STATUS_LABELS[status],
+            'status_code': int(status),
+            'significance': 'significant' if abs(variance_pct) > 15 else 'minor'
+        }
+
+    forecast = float(forecast)
+    margin_of_error = 1.96 * float(se_pred)
+    forecast_result = {
+        'forecast': round(max(0, forecast), 2),
+        'confidence_interval': (
+            round(max(0, forecast - margin_of_error), 2),
+            round(forecast + margin_of_error, 2)
+        ),
+        'trend': _TREND_LABELS[trend],
+        'slope': round(float(slope), 4)
+    }
+
+    return variance_analysis, _TREND_LABELS[trend], forecast_result
+
+
+# Discretionary categories prioritized for budget reductions
+_DISCRETIONARY_CATEGORIES = ('dining', 'entertainment', 'shopping')
+
+
+def _build_optimize_impl():
+    """
+    Generate an unrolled recommendation builder at import time.
+    The discretionary category list is fixed, so the per-category loop,
+    membership test, and dict lookups are specialized into straight-line
+    code compiled once.
+    """
+    blocks = []
+    for category in _DISCRETIONARY_CATEGORIES:
+        blocks.append("""
+    spending = current_spending.get({category!r}, 0)
+    if spending > 0:
+        # Suggest 10-20% reduction in discretionary categories
+        suggested = min(
+            spending * 0.15,  # 15% reduction
+            required_reduction * 0.4  # Don't exceed 40% of total needed reduction
+        )
+        recommendations.append({{
+            'category': {category!r},
+            'current_spending': spending,
+            'suggested_reduction': round(suggested, 2),
+            'new_budget': round(spending - suggested, 2)
+        }})""".format(category=category))
+
+    source = (
+        "def _optimize_impl(current_spending, required_reduction):\n"
+        "    recommendations = []"
+        + ''.join(blocks)
+        + "\n    return recommendations\n"
+    )
+    namespace = {}
+    exec(compile(source, '<generated _optimize_impl>', 'exec'), namespace)
+    return namespace['_optimize_impl']
+
+
+_optimize_impl = _build_optimize_impl()
+
+
+@lru_cache(maxsize=1024)
+def _optimize_cached(spending_items: tuple, savings_target: float,
+                     total_income: float) -> Dict[str, Any]:
+    """
+    Memoized core of optimize_budget_allocation, keyed on sorted
+    (category, amount) items so repeated queries over the same month's
+    numbers skip the recomputation entirely
+    """
+    current_spending = dict(spending_items)
+    total_spending = sum(current_spending.values())
+
+    # Calculate required reduction
+    required_reduction = max(0, total_spending + savings_target - total_income)
+
+    if required_reduction == 0:
+        return {
+            'status': 'budget_balanced',
+            'recommendations': [],
+            'potential_savings': 0
+        }
+
+    # Identify categories for reduction (prioritize discretionary spending)
+    recommendations = _optimize_impl(current_spending, required_reduction)
+
+    total_potential_savings = sum(rec['suggested_reduction'] for rec in recommendations)
+
+    return {
+        'status': 'optimization_needed',
+        'required_reduction': round(required_reduction, 2),
+        'recommendations': recommendations,
+        'potential_savings': round(total_potential_savings, 2)
+    }
+
+
 class RecommendationEngine:
     """Mathematical optimization for budget recommendations"""
-    
+
     @staticmethod
-    def optimize_budget_allocation(current_spending: Dict[str, float], 
+    def optimize_budget_allocation(current_spending: Dict[str, float],
                                  financial_goals: Dict[str, float],
                                  total_income: float) -> Dict[str, Any]:
         """
         Mathematical optimization for budget reallocation
         """
-        total_spending = sum(current_spending.values())
-        savings_target = financial_goals.get('monthly_savings', 0)
-        
-        # Calculate required reduction
-        required_reduction = max(0, total_spending + savings_target - total_income)
-        
-        if required_reduction == 0:
-            return {
-                'status': 'budget_balanced',
-                'recommendations': [],
-                'potential_savings': 0
-            }
-        
-        # Identify categories for reduction (prioritize discretionary spending)
-        discretionary_categories = ['dining', 'entertainment', 'shopping']
-        recommendations = []
-        
-        for category in discretionary_categories:
-            if category in current_spending and current_spending[category] > 0:
-                # Suggest 10-20% reduction in discretionary categories
-                suggested_reduction = min(
-                    current_spending[category] * 0.15,  # 15% reduction
-                    required_reduction * 0.4  # Don't exceed 40% of total needed reduction
-                )
-                
-                recommendations.append({
-                    'category': category,
-                    'current_spending': current_spending[category],
-                    'suggested_reduction': round(suggested_reduction, 2),
-                    'new_budget': round(current_spending[category] - suggested_reduction, 2)
-                })
-        
-        total_potential_savings = sum(rec['suggested_reduction'] for rec in recommendations)
-        
-        return {
-            'status': 'optimization_needed',
-            'required_reduction': round(required_reduction, 2),
-            'recommendations': recommendations,
-            'potential_savings': round(total_potential_savings, 2)
-        }
+        result = _optimize_cached(
+            tuple(sorted(current_spending.items())),
+            financial_goals.get('monthly_savings', 0),
+            total_income
+        )
+        # Copy the mutable parts so callers can't corrupt the cache entry
+        return {**result, 'recommendations': [dict(rec) for rec in result['recommendations']]}
     
     @staticmethod
     def goal_based_adjustments(current_spending: Dict[str, float],
@@ -3,12 +3,15 @@ Simple Deterministic Financial Algorithms
 Easy to explain and write during interviews
 """
 
-def categorize_transaction(merchant_name, description):
+import functools
+
+
+@functools.lru_cache(maxsize=8192)
+def _categorize_cached(text):
     """
-    Simple rule-based categorization you can write in 30 seconds
+    Cached core of categorize_transaction - merchants repeat, so most
+    lookups are cache hits instead of keyword rescans
     """
-    text = (merchant_name + " " + description).lower()
-    
     if any(word in text for word in ["restaurant", "cafe", "pizza", "burger"]):
         return "dining"
     elif any(word in text for word in ["grocery", "supermarket", "walmart"]):
@@ -19,6 +22,13 @@ def categorize_transaction(merchant_name, description):
         return "other"
 
 
+def categorize_transaction(merchant_name, description):
+    """
+    Simple rule-based categorization you can write in 30 seconds
+    """
+    return _categorize_cached((merchant_name + " " + description).lower())
+
+
 def calculate_budget_variance(actual, budget):
     """
     Basic percentage calculation - interview friendly